@@ -6,16 +6,29 @@
 """
 
 import logging
+from typing import AsyncIterator, List, Optional
+import anyio
+import orjson
 from fastapi import APIRouter, HTTPException, status
-from app.models.schemas import NavigationChatRequest, NavigationChatResponse
+from fastapi.responses import StreamingResponse
+from app.models.schemas import (
+    NavigationChatRequest,
+    NavigationChatResponse,
+    NavigationChatBatchRequest,
+    NavigationChatBatchResponse,
+    NavigationChatBatchItem,
+)
 from app.services.navigation_chatbot_service import navigation_chatbot_service
+from app.services.request_coalescer import navigation_request_coalescer, navigation_concurrency_limiter
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-@router.post("/chat", response_model=NavigationChatResponse, tags=["chat"])
+# 서비스 계층이 이미 검증된 응답 모델을 반환하므로 response_model 재검증은 생략하고
+# responses로 OpenAPI 문서만 유지
+@router.post("/chat", response_model=None, responses={200: {"model": NavigationChatResponse}}, tags=["chat"])
 async def navigation_chat(request: NavigationChatRequest):
     """
     ## 내비게이션 챗봇
@@ -40,6 +53,7 @@ async def navigation_chat(request: NavigationChatRequest):
     - **model**: 사용된 AI 모델명
     - **action_type**: 제안하는 액션 타입
     - **confidence_score**: 응답의 신뢰도 점수 (0.0 ~ 1.0)
+    - **cache_hit**: 캐시된 응답 여부
     
     ### 사용 예시
     ```bash
@@ -63,7 +77,8 @@ async def navigation_chat(request: NavigationChatRequest):
         "response": "괜찮아요! 다음 버스가 곧 올 거예요. 정류장에 앉아서 기다리세요.",
         "model": "gemini-1.5-flash",
         "action_type": "find_next_transport",
-        "confidence_score": 0.95
+        "confidence_score": 0.95,
+        "cache_hit": false
     }
     ```
     
@@ -72,20 +87,120 @@ async def navigation_chat(request: NavigationChatRequest):
     - `422`: 요청 데이터 검증 오류
     """
     try:
-        logger.info(f"내비게이션 챗봇 요청 수신. 메시지: {request.message[:50]}...")
-        logger.info(f"위치: ({request.location.latitude}, {request.location.longitude})")
+        logger.info("내비게이션 챗봇 요청 수신. 메시지: %.50s...", request.message)
         
-        # 내비게이션 챗봇 서비스를 통해 응답 생성
-        response = await navigation_chatbot_service.generate_navigation_response(request)
+        # 처리 중인 동일 요청이 있으면 그 결과를 함께 사용하여 응답 생성
+        response = await navigation_request_coalescer.submit(request)
         
-        logger.info(f"내비게이션 챗봇 응답 생성 완료. 액션: {response.action_type}")
+        logger.info("내비게이션 챗봇 응답 생성 완료. 액션: %s", response.action_type)
         
         return response
         
     except Exception as e:
-        logger.error(f"내비게이션 챗봇 요청 처리 중 오류 발생: {str(e)}")
+        logger.error("내비게이션 챗봇 요청 처리 중 오류 발생: %s", e)
         
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Navigation chatbot error: {str(e)}"
-        ) 
\ No newline at end of file
+        )
+
+async def _run_batch_item(
+    index: int,
+    request: NavigationChatRequest,
+    results: List[Optional[NavigationChatBatchItem]]
+) -> None:
+    """동시 요청 수 제한 하에서 배치 항목 하나를 처리하고 결과 목록에 기록"""
+    # 결과 항목은 서버에서 만든 값이므로 검증 없이 생성
+    try:
+        async with navigation_concurrency_limiter:
+            response = await navigation_chatbot_service.generate_navigation_response(request)
+        results[index] = NavigationChatBatchItem.model_construct(index=index, response=response)
+    except Exception as e:
+        # 한 항목의 실패가 태스크 그룹 전체를 취소하지 않도록 여기서 처리
+        logger.error("배치 항목 %d 처리 중 오류 발생: %s", index, e)
+        results[index] = NavigationChatBatchItem.model_construct(index=index, error=str(e))
+
+@router.post("/chat/batch", response_model=None, responses={200: {"model": NavigationChatBatchResponse}}, tags=["chat"])
+async def navigation_chat_batch(request: NavigationChatBatchRequest):
+    """
+    ## 내비게이션 챗봇 (배치)
+    
+    여러 개의 내비게이션 챗봇 요청을 한 번에 처리하는 엔드포인트입니다.
+    각 요청은 동시에 처리되며, 일부 요청이 실패해도 나머지 결과는 정상적으로 반환됩니다.
+    
+    ### 요청 파라미터
+    - **items**: `/chat` 요청과 동일한 형식의 요청 목록 (1 ~ 20개)
+    
+    ### 응답
+    - **results**: 요청 순서대로 정렬된 항목별 결과
+      - **index**: 요청 목록에서의 순서
+      - **response**: 챗봇 응답 (성공 시)
+      - **error**: 에러 메시지 (실패 시)
+    
+    ### 참고
+    동시에 진행되는 Google AI 요청 수는 `BATCH_MAX_CONCURRENCY` 설정으로 제한됩니다.
+    
+    ### 오류 코드
+    - `422`: 요청 데이터 검증 오류
+    """
+    logger.info("내비게이션 챗봇 배치 요청 수신. 항목 수: %d", len(request.items))
+    
+    results: List[Optional[NavigationChatBatchItem]] = [None] * len(request.items)
+    
+    async with anyio.create_task_group() as tg:
+        for index, item in enumerate(request.items):
+            tg.start_soon(_run_batch_item, index, item, results)
+    
+    return NavigationChatBatchResponse.model_construct(results=results)
+
+async def _sse_generator(request: NavigationChatRequest) -> AsyncIterator[str]:
+    """내비게이션 챗봇 응답 조각을 Server-Sent Events 형식으로 변환"""
+    try:
+        async for delta in navigation_chatbot_service.stream_navigation_response(request):
+            yield f"data: {orjson.dumps({'delta': delta}).decode()}\n\n"
+        yield f"data: {orjson.dumps({'done': True}).decode()}\n\n"
+    except Exception as e:
+        # 스트리밍이 시작된 뒤에는 상태 코드를 바꿀 수 없으므로 에러 이벤트로 전달
+        payload = orjson.dumps({"detail": f"Navigation chatbot error: {str(e)}"}).decode()
+        yield f"event: error\ndata: {payload}\n\n"
+
+@router.post("/chat/stream", tags=["chat"])
+async def navigation_chat_stream(request: NavigationChatRequest):
+    """
+    ## 내비게이션 챗봇 (스트리밍)
+    
+    `/chat`과 같은 요청을 받아 응답을 생성되는 대로 Server-Sent Events로 전송하는 엔드포인트입니다.
+    전체 응답을 기다리지 않고 첫 문장부터 바로 화면에 보여줄 수 있습니다.
+    
+    ### 요청 파라미터
+    `/chat`과 동일합니다.
+    
+    ### 응답 (text/event-stream)
+    - `data: {"delta": "..."}`: 응답 텍스트 조각
+    - `data: {"done": true}`: 응답 완료
+    - `event: error` / `data: {"detail": "..."}`: 생성 중 오류 발생
+    
+    ### 사용 예시
+    ```bash
+    curl -N -X POST "http://localhost:8000/api/v1/chat/stream" \\
+         -H "Content-Type: application/json" \\
+         -d '{
+           "message": "버스를 놓쳤어요",
+           "location": {
+             "latitude": 37.5665,
+             "longitude": 126.9780
+           },
+           "mode": "대중교통"
+         }'
+    ```
+    
+    ### 오류 코드
+    - `422`: 요청 데이터 검증 오류
+    """
+    logger.info("내비게이션 챗봇 스트리밍 요청 수신. 메시지: %.50s...", request.message)
+    
+    return StreamingResponse(
+        content=_sse_generator(request),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
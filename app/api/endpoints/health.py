@@ -5,17 +5,52 @@
 서버 상태, 헬스 체크, 서버 정보 등의 기능을 제공합니다.
 """
 
+import asyncio
 import logging
-from fastapi import APIRouter
+import time
+from functools import lru_cache
+from typing import Tuple
+import orjson
+from fastapi import APIRouter, Depends, Response
 from app.models.schemas import ServerStatus, HealthStatus
-from app.core.config import settings
+from app.core.config import Settings, get_settings, settings_dep
 from app.services.google_ai_service import google_ai_service
+from app.services.navigation_chatbot_service import navigation_chatbot_service
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Google AI Studio 헬스 체크 결과 캐시 (확인 시각, 정상 여부)
+# time.monotonic()은 부팅 시점 기준이므로 첫 요청이 항상 실제 확인을 하도록 -inf로 초기화
+_last_check: Tuple[float, bool] = (float("-inf"), False)
+_check_lock = asyncio.Lock()
+
+@lru_cache(maxsize=1)
+def _server_status_bytes() -> bytes:
+    """서버 상태 응답 본문 (시작 이후 변하지 않으므로 한 번만 직렬화)"""
+    settings = get_settings()
+    return orjson.dumps(ServerStatus(
+        message="Cherry AI - Google AI Studio LLM Server is running!",
+        model=settings.google_ai_model,
+        status="active"
+    ).model_dump())
+
+@lru_cache(maxsize=1)
+def _server_info_bytes() -> bytes:
+    """서버 정보 응답 본문 (시작 이후 변하지 않으므로 한 번만 직렬화)"""
+    settings = get_settings()
+    return orjson.dumps({
+        "server": {
+            "title": settings.api_title,
+            "version": settings.api_version,
+            "host": settings.host,
+            "port": settings.port
+        },
+        "model": google_ai_service.get_model_info()
+    })
+
 @router.get("/", response_model=ServerStatus, tags=["health"])
 async def root():
     """
@@ -39,19 +74,75 @@ async def root():
     """
     logger.debug("서버 상태 확인 요청")
     
-    return ServerStatus(
-        message="Cherry AI - Google AI Studio LLM Server is running!",
-        model=settings.google_ai_model,
-        status="active"
-    )
+    return Response(content=_server_status_bytes(), media_type="application/json")
+
+async def _check_google_ai_health() -> bool:
+    """
+    Google AI Studio 헬스 체크 (짧은 TTL 캐시 적용)
+    
+    로드 밸런서의 잦은 헬스 체크가 매번 Google AI Studio를 호출하지 않도록
+    health_check_cache_ttl초 동안 마지막 결과를 재사용합니다.
+    
+    Returns:
+        bool: 서비스 상태 (True: 정상, False: 오류)
+    """
+    global _last_check
+    
+    ttl = get_settings().health_check_cache_ttl
+    if time.monotonic() - _last_check[0] < ttl:
+        return _last_check[1]
+    
+    async with _check_lock:
+        # 잠금 대기 중 다른 요청이 이미 갱신했으면 그 결과 사용
+        if time.monotonic() - _last_check[0] < ttl:
+            return _last_check[1]
+        
+        healthy = await google_ai_service.health_check()
+        _last_check = (time.monotonic(), healthy)
+        return healthy
 
-@router.get("/health", response_model=HealthStatus, tags=["health"])
-async def health_check():
+# 응답 모델은 서버에서 직접 만들므로 response_model 재검증은 생략하고 responses로 문서만 유지
+@router.get("/health", response_model=None, responses={200: {"model": HealthStatus}}, tags=["health"])
+async def health_check(settings: Settings = Depends(settings_dep)):
     """
     ## 헬스 체크
     
     서버의 헬스 상태를 확인하는 엔드포인트입니다.
-    Google AI Studio 서비스의 연결 상태도 함께 확인합니다.
+    Google AI Studio를 호출하지 않고 서비스 초기화 상태만 확인하므로
+    로드 밸런서의 잦은 헬스 체크에 사용할 수 있습니다.
+    
+    ### 응답
+    - **status**: 서버 헬스 상태 (healthy/unhealthy)
+    - **model**: 사용 중인 AI 모델
+    
+    ### 응답 예시
+    ```json
+    {
+        "status": "healthy",
+        "model": "gemini-pro"
+    }
+    ```
+    
+    ### 상태 설명
+    - `healthy`: 서버와 내비게이션 챗봇 서비스가 요청을 처리할 준비가 됨
+    - `unhealthy`: 내비게이션 챗봇 서비스가 초기화되지 않음
+    """
+    logger.debug("헬스 체크 요청")
+    
+    status_value = "healthy" if navigation_chatbot_service.is_ready() else "unhealthy"
+    
+    return HealthStatus(
+        status=status_value,
+        model=settings.google_ai_model
+    )
+
+@router.get("/health/deep", response_model=None, responses={200: {"model": HealthStatus}}, tags=["health"])
+async def deep_health_check(settings: Settings = Depends(settings_dep)):
+    """
+    ## 상세 헬스 체크
+    
+    Google AI Studio에 실제 테스트 요청을 보내 연결 상태까지 확인하는 엔드포인트입니다.
+    외부 API를 호출하므로 로드 밸런서 헬스 체크에는 `/health`를 사용하세요.
     
     ### 응답
     - **status**: 서버 헬스 상태 (healthy/unhealthy)
@@ -68,16 +159,18 @@ async def health_check():
     ### 상태 설명
     - `healthy`: 서버와 Google AI Studio 서비스가 모두 정상
     - `unhealthy`: 서버는 정상이지만 Google AI Studio 서비스에 문제
+    
+    Google AI Studio 확인 결과는 짧은 시간(기본 5초) 동안 캐시됩니다.
     """
-    logger.debug("헬스 체크 요청")
+    logger.debug("상세 헬스 체크 요청")
     
     try:
         # Google AI Studio 서비스 헬스 체크
-        google_ai_healthy = await google_ai_service.health_check()
+        google_ai_healthy = await _check_google_ai_health()
         
         status_value = "healthy" if google_ai_healthy else "unhealthy"
         
-        logger.info(f"헬스 체크 완료. 상태: {status_value}")
+        logger.info("상세 헬스 체크 완료. 상태: %s", status_value)
         
         return HealthStatus(
             status=status_value,
@@ -85,7 +178,7 @@ async def health_check():
         )
         
     except Exception as e:
-        logger.error(f"헬스 체크 중 오류 발생: {str(e)}")
+        logger.error("상세 헬스 체크 중 오류 발생: %s", e)
         
         return HealthStatus(
             status="unhealthy",
@@ -128,12 +221,4 @@ async def get_server_info():
     """
     logger.debug("서버 정보 요청")
     
-    return {
-        "server": {
-            "title": settings.api_title,
-            "version": settings.api_version,
-            "host": settings.host,
-            "port": settings.port
-        },
-        "model": google_ai_service.get_model_info()
-    } 
\ No newline at end of file
+    return Response(content=_server_info_bytes(), media_type="application/json") 
\ No newline at end of file
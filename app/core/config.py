@@ -5,14 +5,17 @@
 환경 변수, API 설정, 서버 설정 등을 포함합니다.
 """
 
-import os
-from typing import Optional
-from pydantic import Field, validator
-from pydantic_settings import BaseSettings
+from functools import lru_cache
+from pathlib import Path
+from typing import Literal
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from dotenv import load_dotenv
 
-# 환경 변수 로드
-load_dotenv()
+@lru_cache
+def _load_description() -> str:
+    """API 설명 마크다운 파일 로드 (프로세스당 한 번)"""
+    return Path(__file__).parent.joinpath("api_description.md").read_text("utf-8")
 
 class Settings(BaseSettings):
     """
@@ -32,37 +35,7 @@ class Settings(BaseSettings):
         description="API 버전"
     )
     api_description: str = Field(
-        default="""
-        ## Cherry AI - 발달장애인을 위한 내비게이션 챗봇
-        
-        발달장애인과 경계선 지능인을 위한 친근하고 이해하기 쉬운 내비게이션 도우미입니다.
-        
-        ### 주요 기능
-        - 🗺️ 길을 이탈했을 때 즉시 해결책 제공
-        - 🚌 대중교통을 놓쳤을 때 대안 경로 안내
-        - 🆘 긴급 상황에서 안전한 해결책 제시
-        - 💬 사회적 상호작용을 통한 도움 요청 방법 안내
-        - 🧠 발달장애인과 경계선 지능인에 특화된 간단하고 명확한 답변
-        
-        ### 지원 상황
-        - 길 이탈 상황
-        - 버스/지하철 놓침 상황
-        - 긴급 상황 (어두운 곳에서 길 잃음 등)
-        - 일반 길 찾기
-        
-        ### 사용 방법
-        1. 현재 위치 정보를 입력하세요
-        2. 목적지 주소를 입력하세요 (선택사항)
-        3. 이동 수단을 선택하세요 (도보/대중교통)
-        4. 상황을 설명하세요
-        5. 즉시 해결책을 받으세요
-        
-        ### 특징
-        - 단발성 완결 답변으로 추가 질문 불필요
-        - 구현되지 않은 기능 언급 제거
-        - 주변 사람에게 도움 요청하는 구체적 방법 제시
-        - 발달장애인 친화적 언어 사용
-        """,
+        default_factory=_load_description,
         description="API 설명"
     )
     
@@ -87,7 +60,12 @@ class Settings(BaseSettings):
         ..., 
         description="Google AI Studio API 키 (필수)"
     )
-    google_ai_model: str = Field(
+    google_ai_model: Literal[
+        'gemini-1.5-flash',
+        'gemini-1.5-pro',
+        'gemini-pro',
+        'gemini-pro-vision'
+    ] = Field(
         default="gemini-1.5-flash", 
         description="사용할 Google AI Studio 모델명"
     )
@@ -106,35 +84,38 @@ class Settings(BaseSettings):
         le=8000
     )
     
-    # ==================== 검증 메서드 ====================
-    @validator('google_ai_model')
-    def validate_google_ai_model(cls, v):
-        """Google AI 모델명 검증"""
-        valid_models = [
-            'gemini-1.5-flash',
-            'gemini-1.5-pro',
-            'gemini-pro',
-            'gemini-pro-vision'
-        ]
-        if v not in valid_models:
-            raise ValueError(f'지원하지 않는 모델입니다. 지원 모델: {valid_models}')
-        return v
+    # ==================== 배치 설정 ====================
+    batch_max_concurrency: int = Field(
+        default=8,
+        description="내비게이션 챗봇(/chat, /chat/batch)의 동시 Google AI 요청 수 상한",
+        ge=1,
+        le=64
+    )
     
-    @validator('port')
-    def validate_port(cls, v):
-        """포트 번호 검증"""
-        if v < 1024 or v > 65535:
-            raise ValueError('포트 번호는 1024-65535 사이여야 합니다.')
-        return v
+    # ==================== 캐시 설정 ====================
+    response_cache_size: int = Field(
+        default=4096,
+        description="내비게이션 챗봇 응답 캐시 최대 항목 수",
+        ge=1
+    )
+    response_cache_ttl: int = Field(
+        default=300,
+        description="내비게이션 챗봇 응답 캐시 유지 시간 (초)",
+        ge=1
+    )
+    health_check_cache_ttl: float = Field(
+        default=5.0,
+        description="Google AI Studio 헬스 체크 결과 캐시 유지 시간 (초)",
+        ge=0.0
+    )
     
-    class Config:
-        """Pydantic 설정"""
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = False
-        extra_forbidden = False
+    # ==================== Pydantic 설정 ====================
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
         # 환경 변수 예시
-        schema_extra = {
+        json_schema_extra={
             "example": {
                 "api_title": "Cherry AI - Vertex AI LLM Server",
                 "api_version": "1.0.0",
@@ -145,10 +126,28 @@ class Settings(BaseSettings):
                 "default_max_tokens": 1000
             }
         }
+    )
 
-# 전역 설정 인스턴스
-settings = Settings()
+@lru_cache
+def get_settings() -> Settings:
+    """
+    설정 인스턴스 반환
+    
+    최초 호출 시 한 번만 .env 파일을 읽고 Settings를 생성하며,
+    이후에는 캐시된 인스턴스를 반환합니다.
+    
+    Returns:
+        Settings: 애플리케이션 설정 인스턴스
+    """
+    # 환경 변수 로드
+    load_dotenv()
+    return Settings()
 
-# API 키 검증
-if not settings.google_api_key:
-    raise ValueError("GOOGLE_API_KEY environment variable is required") 
\ No newline at end of file
+def settings_dep() -> Settings:
+    """
+    FastAPI 의존성 주입용 설정 반환
+    
+    Example:
+        >>> async def endpoint(settings: Settings = Depends(settings_dep)): ...
+    """
+    return get_settings()
@@ -5,8 +5,8 @@ API 요청/응답 스키마 정의
 Pydantic을 사용하여 데이터 검증과 자동 문서화를 제공합니다.
 """
 
-from typing import Optional
-from pydantic import BaseModel, Field, validator
+from typing import Annotated, List, Literal, Optional
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, field_validator
 
 # ==================== 공통 스키마 ====================
 
@@ -26,15 +26,15 @@ class ServerStatus(BaseModel):
         description="서버 상태 (active/inactive)"
     )
     
-    class Config:
-        """Pydantic 설정"""
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "message": "Cherry AI - 발달장애인을 위한 내비게이션 챗봇 서버가 실행 중입니다!",
                 "model": "gemini-1.5-flash",
                 "status": "active"
             }
         }
+    )
 
 class HealthStatus(BaseModel):
     """
@@ -49,14 +49,14 @@ class HealthStatus(BaseModel):
         description="사용 중인 AI 모델"
     )
     
-    class Config:
-        """Pydantic 설정"""
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "status": "healthy",
                 "model": "gemini-pro"
             }
         }
+    )
 
 class ErrorResponse(BaseModel):
     """
@@ -72,14 +72,14 @@ class ErrorResponse(BaseModel):
         description="에러 코드"
     )
     
-    class Config:
-        """Pydantic 설정"""
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "detail": "Vertex AI 통신 오류: API 키가 유효하지 않습니다.",
                 "error_code": "VERTEX_AI_ERROR"
             }
-        } 
+        }
+    ) 
 
 # ==================== 지도 챗봇 스키마 ====================
 
@@ -94,29 +94,15 @@ class LocationInfo(BaseModel):
         description="위도 (latitude)",
         ge=-90.0,
         le=90.0,
-        example=37.5665
+        examples=[37.5665]
     )
     longitude: float = Field(
         ...,
         description="경도 (longitude)",
         ge=-180.0,
         le=180.0,
-        example=126.9780
+        examples=[126.9780]
     )
-    
-    @validator('latitude')
-    def validate_latitude(cls, v):
-        """위도 검증"""
-        if v < -90 or v > 90:
-            raise ValueError('위도는 -90에서 90 사이여야 합니다.')
-        return v
-    
-    @validator('longitude')
-    def validate_longitude(cls, v):
-        """경도 검증"""
-        if v < -180 or v > 180:
-            raise ValueError('경도는 -180에서 180 사이여야 합니다.')
-        return v
 
 class NavigationChatRequest(BaseModel):
     """
@@ -124,12 +110,13 @@ class NavigationChatRequest(BaseModel):
     
     발달장애인과 경계선 지능인을 위한 지도 챗봇 요청 데이터 구조를 정의합니다.
     """
-    message: str = Field(
+    message: Annotated[
+        str,
+        StringConstraints(strip_whitespace=True, min_length=1, max_length=1000)
+    ] = Field(
         ...,
         description="사용자의 질문이나 도움 요청 메시지",
-        example="길을 이탈했어요",
-        min_length=1,
-        max_length=1000
+        examples=["길을 이탈했어요"]
     )
     location: LocationInfo = Field(
         ...,
@@ -138,26 +125,20 @@ class NavigationChatRequest(BaseModel):
     destination_address: Optional[str] = Field(
         default=None,
         description="목적지 주소 (선택사항)",
-        example="서울시 강남구 테헤란로 123"
+        examples=["서울시 강남구 테헤란로 123"]
     )
-    mode: Optional[str] = Field(
+    mode: Literal['도보', '대중교통', '홈'] = Field(
         default="홈",
         description="이동 수단 (도보, 대중교통) 또는 홈 화면에서의 일반 대화 (홈)"
     )
     user_context: Optional[str] = Field(
         default=None,
         description="사용자 상황 설명 (선택사항)",
-        example="지하철을 놓쳤어요"
+        examples=["지하철을 놓쳤어요"]
     )
     
-    @validator('message')
-    def validate_message(cls, v):
-        """메시지 검증"""
-        if not v.strip():
-            raise ValueError('메시지는 비어있을 수 없습니다.')
-        return v.strip()
-    
-    @validator('destination_address')
+    @field_validator('destination_address')
+    @classmethod
     def validate_destination_address(cls, v):
         """목적지 주소 검증"""
         # 목적지 주소가 빈 문자열이면 None으로 변환
@@ -165,21 +146,17 @@ class NavigationChatRequest(BaseModel):
             return None
         return v
     
-    @validator('mode')
-    def validate_mode(cls, v):
-        """이동 수단 검증"""
-        # mode가 None이거나 빈 문자열이면 기본값 "홈" 사용
-        if v is None or v.strip() == "":
+    @field_validator('mode', mode='before')
+    @classmethod
+    def normalize_mode(cls, v):
+        """이동 수단 정규화"""
+        # mode가 None이거나 빈 문자열이면 기본값 "홈" 사용 (허용 값 검증은 Literal 타입이 담당)
+        if v is None or (isinstance(v, str) and v.strip() == ""):
             return "홈"
-        
-        valid_modes = ['도보', '대중교통', '홈']
-        if v not in valid_modes:
-            raise ValueError(f'지원하지 않는 이동 수단입니다. 지원: {valid_modes}')
         return v
     
-    class Config:
-        """Pydantic 설정"""
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "message": "길을 이탈했어요",
                 "location": {
@@ -191,6 +168,7 @@ class NavigationChatRequest(BaseModel):
                 "user_context": "지하철을 놓쳤어요"
             }
         }
+    )
 
 class NavigationChatResponse(BaseModel):
     """
@@ -216,14 +194,62 @@ class NavigationChatResponse(BaseModel):
         ge=0.0,
         le=1.0
     )
+    cache_hit: bool = Field(
+        default=False,
+        description="캐시된 응답 여부"
+    )
     
-    class Config:
-        """Pydantic 설정"""
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "response": "걱정하지 마세요! 현재 위치에서 가장 가까운 지하철역을 찾아드릴게요.",
                 "model": "gemini-1.5-flash",
                 "action_type": "find_nearby_station",
-                "confidence_score": 0.95
+                "confidence_score": 0.95,
+                "cache_hit": False
             }
-        } 
\ No newline at end of file
+        }
+    )
+
+class NavigationChatBatchRequest(BaseModel):
+    """
+    내비게이션 챗봇 배치 요청 스키마
+    
+    여러 개의 내비게이션 챗봇 요청을 한 번에 처리하기 위한 스키마입니다.
+    """
+    items: List[NavigationChatRequest] = Field(
+        ...,
+        description="내비게이션 챗봇 요청 목록 (최대 20개)",
+        min_length=1,
+        max_length=20
+    )
+
+class NavigationChatBatchItem(BaseModel):
+    """
+    내비게이션 챗봇 배치 응답 항목 스키마
+    
+    배치 요청의 개별 항목 처리 결과입니다. 성공 시 response, 실패 시 error가 채워집니다.
+    """
+    index: int = Field(
+        ...,
+        description="요청 목록에서의 순서 (0부터 시작)"
+    )
+    response: Optional[NavigationChatResponse] = Field(
+        default=None,
+        description="챗봇 응답 (성공 시)"
+    )
+    error: Optional[str] = Field(
+        default=None,
+        description="에러 메시지 (실패 시)"
+    )
+
+class NavigationChatBatchResponse(BaseModel):
+    """
+    내비게이션 챗봇 배치 응답 스키마
+    
+    배치 요청의 항목별 처리 결과를 요청 순서대로 담는 스키마입니다.
+    """
+    results: List[NavigationChatBatchItem] = Field(
+        ...,
+        description="항목별 처리 결과 목록"
+    )
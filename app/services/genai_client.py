@@ -0,0 +1,37 @@
+"""
+Google AI Studio 클라이언트 모듈
+
+genai.configure 호출과 GenerativeModel 생성을 한 곳에서 관리합니다.
+gRPC 클라이언트는 SDK가 이미 프로세스 단위로 공유하므로, 이 모듈은 설정을
+한 번만 적용하고 모델명별 인스턴스를 재사용하는 역할만 합니다.
+"""
+
+import logging
+from typing import Dict
+import google.generativeai as genai
+from app.core.config import get_settings
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# Google AI Studio 설정 (프로세스당 한 번)
+genai.configure(api_key=get_settings().google_api_key)
+
+# 모델명별 GenerativeModel 캐시
+_model_cache: Dict[str, genai.GenerativeModel] = {}
+
+def get_generative_model(model_name: str) -> genai.GenerativeModel:
+    """
+    캐시된 GenerativeModel 인스턴스 반환
+    
+    Args:
+        model_name (str): Google AI Studio 모델명
+        
+    Returns:
+        genai.GenerativeModel: 모델명에 해당하는 공유 인스턴스
+    """
+    model = _model_cache.get(model_name)
+    if model is None:
+        model = _model_cache[model_name] = genai.GenerativeModel(model_name)
+        logger.info("Google AI Studio 모델 인스턴스 생성. 모델: %s", model_name)
+    return model
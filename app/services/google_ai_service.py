@@ -8,7 +8,8 @@ import os
 import logging
 from typing import Optional
 import google.generativeai as genai
-from app.core.config import settings
+from app.core.config import get_settings
+from app.services.genai_client import get_generative_model
 from app.models.schemas import NavigationChatRequest, NavigationChatResponse
 
 # 로거 설정
@@ -29,8 +30,7 @@ class GoogleAIService:
         Google AI Studio API 키를 설정하고 모델을 초기화합니다.
         """
         try:
-            # Google AI Studio 설정
-            genai.configure(api_key=settings.google_api_key)
+            settings = get_settings()
             
             # 시스템 프롬프트 정의
             self.system_prompt = """
@@ -58,13 +58,13 @@ class GoogleAIService:
 사용자의 질문에 정확하고 유용한 답변을 제공하세요.
 """
             
-            # 모델 초기화 (구버전 호환)
-            self.model = genai.GenerativeModel(settings.google_ai_model)
+            # 공유 모델 클라이언트 사용
+            self.model = get_generative_model(settings.google_ai_model)
             
-            logger.info(f"Google AI Studio 서비스 초기화 완료. 모델: {settings.google_ai_model}")
+            logger.info("Google AI Studio 서비스 초기화 완료. 모델: %s", settings.google_ai_model)
             
         except Exception as e:
-            logger.error(f"Google AI Studio 서비스 초기화 실패: {str(e)}")
+            logger.error("Google AI Studio 서비스 초기화 실패: %s", e)
             raise
     
     def _preprocess_prompt(self, message: str) -> str:
@@ -127,8 +127,10 @@ class GoogleAIService:
             >>> response = await service.generate_response(request)
             >>> print(response.response)
         """
+        settings = get_settings()
+        
         try:
-            logger.info(f"Google AI Studio 요청 시작. 메시지 길이: {len(request.message)}")
+            logger.info("Google AI Studio 요청 시작. 메시지 길이: %d", len(request.message))
             
             # 메시지 전처리
             processed_message = self._preprocess_prompt(request.message)
@@ -136,8 +138,8 @@ class GoogleAIService:
             # 시스템 프롬프트와 사용자 메시지 결합
             full_prompt = f"{self.system_prompt}\n\n사용자 질문: {processed_message}\n\n답변:"
             
-            # Google AI Studio에 요청 전송 (고정된 설정 사용)
-            response = self.model.generate_content(
+            # Google AI Studio에 요청 전송 (고정된 설정 사용, 공유 비동기 gRPC 채널 사용)
+            response = await self.model.generate_content_async(
                 full_prompt,
                 generation_config=genai.types.GenerationConfig(
                     temperature=settings.default_temperature,  # 0.2로 낮춤
@@ -148,7 +150,7 @@ class GoogleAIService:
                 )
             )
             
-            logger.info(f"Google AI Studio 응답 생성 완료. 응답 길이: {len(response.text)}")
+            logger.info("Google AI Studio 응답 생성 완료. 응답 길이: %d", len(response.text))
             
             return NavigationChatResponse(
                 response=response.text,
@@ -156,7 +158,7 @@ class GoogleAIService:
             )
             
         except Exception as e:
-            logger.error(f"Google AI Studio 통신 오류: {str(e)}")
+            logger.error("Google AI Studio 통신 오류: %s", e)
             raise Exception(f"Google AI Studio 통신 오류: {str(e)}")
     
     async def health_check(self) -> bool:
@@ -175,14 +177,17 @@ class GoogleAIService:
         try:
             logger.debug("Google AI Studio 헬스 체크 시작")
             
-            # 간단한 테스트 요청
-            test_response = self.model.generate_content("Hello")
+            # 간단한 테스트 요청 (공유 비동기 gRPC 채널 사용, 출력은 최소화)
+            await self.model.generate_content_async(
+                "Hello",
+                generation_config=genai.types.GenerationConfig(max_output_tokens=1)
+            )
             
             logger.debug("Google AI Studio 헬스 체크 성공")
             return True
             
         except Exception as e:
-            logger.error(f"Google AI Studio 헬스 체크 실패: {str(e)}")
+            logger.error("Google AI Studio 헬스 체크 실패: %s", e)
             return False
     
     def get_model_info(self) -> dict:
@@ -199,6 +204,8 @@ class GoogleAIService:
             >>> print(f"모델: {info['model']}")
             >>> print(f"기본 temperature: {info['temperature_default']}")
         """
+        settings = get_settings()
+        
         return {
             "model": settings.google_ai_model,
             "temperature_default": settings.default_temperature,
@@ -220,6 +227,8 @@ class GoogleAIService:
         Returns:
             dict: 서비스 상태 정보
         """
+        settings = get_settings()
+        
         return {
             "service_name": "Google AI Studio Service",
             "model": settings.google_ai_model,
@@ -5,15 +5,21 @@
 길 이탈, 대중교통 놓침 등의 상황에 대한 도움을 제공합니다.
 """
 
+import hashlib
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, AsyncIterator
 import google.generativeai as genai
-from app.core.config import settings
+from cachetools import TTLCache
+from app.core.config import get_settings
+from app.services.genai_client import get_generative_model
 from app.models.schemas import NavigationChatRequest, NavigationChatResponse, LocationInfo
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# 스트리밍 응답을 잘린 채로 끝내지 않고 오류로 처리할 종료 사유
+_BLOCKED_FINISH_REASONS = frozenset({"SAFETY", "RECITATION", "OTHER"})
+
 class NavigationChatbotService:
     """
     내비게이션 챗봇 서비스 클래스
@@ -27,8 +33,7 @@ class NavigationChatbotService:
         내비게이션 챗봇 서비스 초기화
         """
         try:
-            # Google AI Studio 설정
-            genai.configure(api_key=settings.google_api_key)
+            settings = get_settings()
             
             # 발달장애인/경계선 지능인 특화 시스템 프롬프트
             self.system_prompt = """
@@ -99,15 +104,32 @@ class NavigationChatbotService:
 사용자가 안전하고 편안하게 목적지에 도착할 수 있도록 즉시 완결된 해결책을 제공하세요.
 """
             
-            # 모델 초기화
-            self.model = genai.GenerativeModel(settings.google_ai_model)
+            # 공유 모델 클라이언트 사용
+            self.model = get_generative_model(settings.google_ai_model)
+            
+            # 동일한 요청에 대한 응답 캐시
+            self._response_cache: TTLCache = TTLCache(
+                maxsize=settings.response_cache_size,
+                ttl=settings.response_cache_ttl
+            )
             
             logger.info("내비게이션 챗봇 서비스 초기화 완료")
             
         except Exception as e:
-            logger.error(f"내비게이션 챗봇 서비스 초기화 실패: {str(e)}")
+            logger.error("내비게이션 챗봇 서비스 초기화 실패: %s", e)
             raise
     
+    def is_ready(self) -> bool:
+        """
+        서비스 준비 상태 확인
+        
+        Google AI Studio를 호출하지 않고 모델 클라이언트와 API 키 설정 여부만 확인합니다.
+        
+        Returns:
+            bool: 요청을 처리할 준비가 되었으면 True
+        """
+        return self.model is not None and bool(get_settings().google_api_key)
+    
     def _analyze_situation(self, request: NavigationChatRequest) -> Dict[str, Any]:
         """
         사용자 상황을 분석하여 적절한 대응 전략을 결정
@@ -219,47 +241,95 @@ class NavigationChatbotService:
         
         return "\n".join(context_parts)
     
+    def _build_prompt(self, request: NavigationChatRequest, situation: Dict[str, Any]) -> str:
+        """
+        시스템 프롬프트, 상황 정보, 사용자 메시지를 결합한 전체 프롬프트 생성
+        
+        Args:
+            request (NavigationChatRequest): 사용자 요청
+            situation (Dict[str, Any]): 상황 분석 결과
+            
+        Returns:
+            str: 전체 프롬프트
+        """
+        # 컨텍스트 프롬프트 생성
+        context_prompt = self._create_contextual_prompt(request, situation)
+        
+        return f"""
+{self.system_prompt}
+
+현재 상황:
+{context_prompt}
+
+사용자: {request.message}
+
+발달장애인과 경계선 지능인에게 적합한 매우 간단하고 명확한 답변을 제공하세요.
+"""
+    
+    def _generation_config(self) -> genai.types.GenerationConfig:
+        """내비게이션 챗봇 응답 생성 설정"""
+        return genai.types.GenerationConfig(
+            temperature=0.3,  # 일관성과 창의성의 균형
+            max_output_tokens=800,
+            top_p=0.8,
+            top_k=40,
+            candidate_count=1
+        )
+    
+    def make_cache_key(self, request: NavigationChatRequest) -> str:
+        """
+        응답 캐시 키 생성
+        
+        위치는 소수점 셋째 자리(약 100m)로 묶어서 가까운 위치의 같은 질문이 캐시를 공유하도록 합니다.
+        
+        Args:
+            request (NavigationChatRequest): 사용자 요청
+            
+        Returns:
+            str: 캐시 키
+        """
+        raw_key = "|".join([
+            request.message,
+            f"{round(request.location.latitude, 3)}",
+            f"{round(request.location.longitude, 3)}",
+            f"{request.mode}",
+            f"{request.destination_address}",
+            f"{request.user_context}"
+        ])
+        return hashlib.blake2b(raw_key.encode("utf-8"), digest_size=16).hexdigest()
+    
     async def generate_navigation_response(self, request: NavigationChatRequest) -> NavigationChatResponse:
         """
         내비게이션 챗봇 응답 생성
         
+        같은 요청(메시지, 위치, 이동 수단, 목적지, 상황)에 대한 응답이 캐시에 있으면
+        Google AI Studio를 호출하지 않고 캐시된 응답을 반환합니다.
+        
         Args:
             request (NavigationChatRequest): 내비게이션 챗봇 요청
             
         Returns:
             NavigationChatResponse: 챗봇 응답
         """
+        cache_key = self.make_cache_key(request)
+        cached_response = self._response_cache.get(cache_key)
+        if cached_response is not None:
+            logger.info("내비게이션 챗봇 응답 캐시 적중")
+            return cached_response.model_copy(update={"cache_hit": True})
+        
         try:
-            logger.info(f"내비게이션 챗봇 요청 수신: {request.message}")
+            logger.info("내비게이션 챗봇 요청 수신: %s", request.message)
             
             # 상황 분석
             situation = self._analyze_situation(request)
             
-            # 컨텍스트 프롬프트 생성
-            context_prompt = self._create_contextual_prompt(request, situation)
-            
             # 전체 프롬프트 구성
-            full_prompt = f"""
-{self.system_prompt}
-
-현재 상황:
-{context_prompt}
-
-사용자: {request.message}
-
-발달장애인과 경계선 지능인에게 적합한 매우 간단하고 명확한 답변을 제공하세요.
-"""
+            full_prompt = self._build_prompt(request, situation)
             
-            # AI 응답 생성
-            response = self.model.generate_content(
+            # AI 응답 생성 (비동기 클라이언트 사용으로 이벤트 루프 블로킹 방지)
+            response = await self.model.generate_content_async(
                 full_prompt,
-                generation_config=genai.types.GenerationConfig(
-                    temperature=0.3,  # 일관성과 창의성의 균형
-                    max_output_tokens=800,
-                    top_p=0.8,
-                    top_k=40,
-                    candidate_count=1
-                )
+                generation_config=self._generation_config()
             )
             
             # 응답 후처리
@@ -271,17 +341,65 @@ class NavigationChatbotService:
             # 신뢰도 점수 계산 (상황의 명확성에 기반)
             confidence_score = 0.9 if situation["type"] != "unknown" else 0.7
             
-            logger.info(f"내비게이션 챗봇 응답 생성 완료. 액션: {action_type}")
+            logger.info("내비게이션 챗봇 응답 생성 완료. 액션: %s", action_type)
             
-            return NavigationChatResponse(
+            # 서버에서 계산한 값이므로 검증 없이 생성
+            navigation_response = NavigationChatResponse.model_construct(
                 response=response_text,
-                model=settings.google_ai_model,
+                model=get_settings().google_ai_model,
                 action_type=action_type,
                 confidence_score=confidence_score
             )
+            self._response_cache[cache_key] = navigation_response
+            
+            return navigation_response
+            
+        except Exception as e:
+            logger.error("내비게이션 챗봇 응답 생성 실패: %s", e)
+            raise Exception(f"내비게이션 챗봇 오류: {str(e)}")
+    
+    async def stream_navigation_response(self, request: NavigationChatRequest) -> AsyncIterator[str]:
+        """
+        내비게이션 챗봇 응답을 생성되는 대로 조각 단위로 반환
+        
+        Args:
+            request (NavigationChatRequest): 내비게이션 챗봇 요청
+            
+        Yields:
+            str: 응답 텍스트 조각
+        """
+        try:
+            logger.info("내비게이션 챗봇 스트리밍 요청 수신: %s", request.message)
+            
+            # 상황 분석 및 프롬프트 구성
+            situation = self._analyze_situation(request)
+            full_prompt = self._build_prompt(request, situation)
+            
+            response = await self.model.generate_content_async(
+                full_prompt,
+                generation_config=self._generation_config(),
+                stream=True
+            )
+            
+            async for chunk in response:
+                # 프롬프트 자체가 차단되면 candidates가 비어 있고 chunk.parts/chunk.text는
+                # ValueError를 발생시키므로 응답 상태를 직접 확인
+                if chunk.prompt_feedback.block_reason or not chunk.candidates:
+                    raise ValueError(f"프롬프트가 차단되었습니다: {chunk.prompt_feedback.block_reason.name}")
+                
+                # 생성 도중 차단되면 잘린 응답이 정상 완료로 전달되지 않도록 오류로 처리
+                candidate = chunk.candidates[0]
+                if candidate.finish_reason.name in _BLOCKED_FINISH_REASONS:
+                    raise ValueError(f"응답 생성이 중단되었습니다: {candidate.finish_reason.name}")
+                
+                text = "".join(part.text for part in candidate.content.parts if part.text)
+                if text:
+                    yield text
+            
+            logger.info("내비게이션 챗봇 스트리밍 응답 완료")
             
         except Exception as e:
-            logger.error(f"내비게이션 챗봇 응답 생성 실패: {str(e)}")
+            logger.error("내비게이션 챗봇 스트리밍 응답 생성 실패: %s", e)
             raise Exception(f"내비게이션 챗봇 오류: {str(e)}")
 
 # 전역 서비스 인스턴스
@@ -0,0 +1,105 @@
+"""
+요청 병합 모듈
+
+동시에 들어온 동일한 내비게이션 챗봇 요청을 하나의 Google AI 호출로 병합합니다.
+같은 키의 요청이 처리 중이면 새 호출을 만들지 않고 진행 중인 결과를 함께 기다립니다.
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict
+import anyio
+from app.core.config import get_settings
+from app.services.navigation_chatbot_service import navigation_chatbot_service
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 내비게이션 챗봇의 Google AI 동시 요청 수 제한 (/chat, /chat/batch 공유)
+navigation_concurrency_limiter = anyio.Semaphore(get_settings().batch_max_concurrency)
+
+class _InFlight:
+    """처리 중인 요청 (공유 태스크와 대기 중인 호출자 수)"""
+    
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+class RequestCoalescer:
+    """
+    요청 병합 클래스
+    
+    key_func가 같은 값을 반환하는 요청이 동시에 들어오면 handler를 한 번만 호출하고
+    모든 호출자에게 같은 결과(또는 예외)를 전달합니다.
+    기다리는 호출자가 모두 취소되면 진행 중인 handler 호출도 취소합니다.
+    """
+    
+    def __init__(
+        self,
+        handler: Callable[[Any], Awaitable[Any]],
+        key_func: Callable[[Any], str],
+        limiter: anyio.Semaphore
+    ):
+        """
+        요청 병합기 초기화
+        
+        Args:
+            handler (Callable): 개별 요청을 처리하는 비동기 함수
+            key_func (Callable): 병합 여부를 결정하는 요청 키 생성 함수
+            limiter (anyio.Semaphore): handler 동시 실행 수를 제한하는 세마포어
+        """
+        self.handler = handler
+        self.key_func = key_func
+        self.limiter = limiter
+        self._inflight: Dict[str, _InFlight] = {}
+    
+    async def submit(self, request: Any) -> Any:
+        """
+        요청을 처리하거나, 같은 요청이 처리 중이면 그 결과를 함께 기다림
+        
+        Args:
+            request (Any): handler에 전달할 요청 객체
+            
+        Returns:
+            Any: handler의 처리 결과
+            
+        Raises:
+            Exception: handler에서 발생한 예외를 그대로 전달
+        """
+        key = self.key_func(request)
+        
+        entry = self._inflight.get(key)
+        if entry is None:
+            entry = _InFlight(asyncio.create_task(self._handle(request)))
+            self._inflight[key] = entry
+            entry.task.add_done_callback(lambda _, key=key, entry=entry: self._release(key, entry))
+        else:
+            logger.debug("처리 중인 동일 요청에 병합")
+        
+        entry.waiters += 1
+        try:
+            # 한 호출자의 취소가 공유 태스크를 취소하지 않도록 보호
+            return await asyncio.shield(entry.task)
+        finally:
+            entry.waiters -= 1
+            if entry.waiters == 0 and not entry.task.done():
+                # 기다리는 호출자가 없으면 Google AI 호출도 중단
+                self._release(key, entry)
+                entry.task.cancel()
+    
+    async def _handle(self, request: Any) -> Any:
+        """동시 실행 수 제한 하에서 요청 하나를 처리"""
+        async with self.limiter:
+            return await self.handler(request)
+    
+    def _release(self, key: str, entry: _InFlight) -> None:
+        """처리 중 목록에서 요청 제거 (같은 키의 새 요청이 이미 등록된 경우는 유지)"""
+        if self._inflight.get(key) is entry:
+            del self._inflight[key]
+
+# 전역 요청 병합기 인스턴스
+navigation_request_coalescer = RequestCoalescer(
+    navigation_chatbot_service.generate_navigation_response,
+    key_func=navigation_chatbot_service.make_cache_key,
+    limiter=navigation_concurrency_limiter
+)
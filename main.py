@@ -13,9 +13,17 @@ FastAPI와 Google AI Studio를 사용한 간단한 LLM 서버입니다.
 """
 
 import logging
+from typing import Dict
+import orjson
 import uvicorn
-from fastapi import FastAPI
-from app.core.config import settings
+from fastapi import FastAPI, Request, Response
+from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html, get_swagger_ui_oauth2_redirect_html
+from fastapi.middleware.gzip import GZipMiddleware
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipResponder
+from starlette.types import Message, Receive, Scope, Send
+from fastapi.responses import ORJSONResponse
+from app.core.config import get_settings
 from app.api.api import api_router
 
 # 로깅 설정
@@ -25,6 +33,41 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+class _StreamAwareGZipResponder(GZipResponder):
+    """Content-Type이 text/event-stream인 응답은 압축하지 않고 그대로 전달하는 GZip 응답기"""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.passthrough = False
+    
+    async def send_with_gzip(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            content_type = Headers(raw=message["headers"]).get("content-type", "")
+            self.passthrough = content_type.startswith("text/event-stream")
+        
+        if self.passthrough:
+            await self.send(message)
+            return
+        await super().send_with_gzip(message)
+
+class StreamAwareGZipMiddleware(GZipMiddleware):
+    """
+    스트리밍 응답을 제외하고 압축하는 GZip 미들웨어
+    
+    GZip 압축기는 작은 조각을 모아서 내보내므로, Server-Sent Events 응답에
+    적용하면 클라이언트가 조각을 바로 받지 못합니다.
+    경로가 아니라 응답의 Content-Type으로 압축 여부를 결정합니다.
+    """
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and "gzip" in Headers(scope=scope).get("Accept-Encoding", ""):
+            responder = _StreamAwareGZipResponder(
+                self.app, self.minimum_size, compresslevel=self.compresslevel
+            )
+            await responder(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
 def create_app() -> FastAPI:
     """
     FastAPI 애플리케이션 생성
@@ -32,10 +75,17 @@ def create_app() -> FastAPI:
     Returns:
         FastAPI: 설정된 FastAPI 애플리케이션 인스턴스
     """
+    settings = get_settings()
+    
     app = FastAPI(
         title=settings.api_title,
         description=settings.api_description,
         version=settings.api_version,
+        default_response_class=ORJSONResponse,
+        # OpenAPI 스키마와 문서 페이지는 아래에서 직접 제공 (미리 직렬화된 스키마 사용)
+        openapi_url=None,
+        docs_url=None,
+        redoc_url=None,
         contact={
             "name": "Cherry AI",
             "url": "https://github.com/gdg-hongik-univ/cherrymap-untitled-ai",
@@ -56,6 +106,9 @@ def create_app() -> FastAPI:
         ]
     )
     
+    # 응답 압축 (한글 JSON 응답 전송량 감소, 스트리밍 응답 제외)
+    app.add_middleware(StreamAwareGZipMiddleware, minimum_size=512)
+    
     # API 라우터 등록
     app.include_router(api_router)
     
@@ -64,49 +117,70 @@ def create_app() -> FastAPI:
 # FastAPI 앱 인스턴스 생성
 app = create_app()
 
-@app.get("/docs")
-async def custom_docs():
-    """
-    ## API 문서
-    
-    이 서버는 발달장애인을 위한 내비게이션 챗봇 API를 제공합니다.
-    
-    ### 사용 가능한 문서
-    - **Swagger UI**: `/docs` - 대화형 API 문서
-    - **ReDoc**: `/redoc` - 읽기 쉬운 API 문서
-    - **OpenAPI Schema**: `/openapi.json` - OpenAPI 스키마
-    
-    ### 주요 엔드포인트
-    - `GET /` - 서버 상태 확인
-    - `POST /api/v1/chat` - 내비게이션 챗봇
-    - `GET /api/v1/health` - 헬스 체크
-    - `GET /api/v1/info` - 서버 정보
-    
-    ### 사용 방법
-    1. API 문서에서 엔드포인트를 확인하세요
-    2. 요청 예시를 참고하여 API를 호출하세요
-    3. 응답 형식을 확인하여 데이터를 처리하세요
-    """
-    return {
-        "message": "API 문서에 접근하려면 다음 URL을 사용하세요:",
-        "swagger_ui": "/docs",
-        "redoc": "/redoc",
-        "openapi_schema": "/openapi.json",
-        "endpoints": {
-            "root": "GET / - 서버 상태 확인",
-            "chat": "POST /api/v1/chat - 내비게이션 챗봇",
-            "health": "GET /api/v1/health - 헬스 체크",
-            "info": "GET /api/v1/info - 서버 정보"
-        }
-    }
+def _root_path(request: Request) -> str:
+    """프록시 경로 접두사 (내장 문서 핸들러와 동일하게 root_path 사용)"""
+    return request.scope.get("root_path", "").rstrip("/")
+
+# root_path별로 직렬화된 OpenAPI 스키마 캐시
+_openapi_cache: Dict[str, bytes] = {}
+
+def _openapi_bytes(root_path: str = "") -> bytes:
+    """OpenAPI 스키마 (root_path별로 한 번만 생성하여 직렬화)"""
+    cached = _openapi_cache.get(root_path)
+    if cached is None:
+        schema = app.openapi()
+        # 내장 핸들러와 동일하게 root_path를 servers 맨 앞에 추가
+        if root_path and app.root_path_in_servers:
+            servers = [server for server in app.servers if server.get("url") != root_path]
+            schema = {**schema, "servers": [{"url": root_path}, *servers]}
+        cached = _openapi_cache[root_path] = orjson.dumps(schema)
+    return cached
+
+@app.get("/openapi.json", include_in_schema=False)
+async def openapi_schema(request: Request):
+    """미리 직렬화된 OpenAPI 스키마 반환"""
+    return Response(content=_openapi_bytes(_root_path(request)), media_type="application/json")
+
+@app.get("/docs", include_in_schema=False)
+async def swagger_ui(request: Request):
+    """Swagger UI 문서 페이지"""
+    root_path = _root_path(request)
+    oauth2_redirect_url = app.swagger_ui_oauth2_redirect_url
+    if oauth2_redirect_url:
+        oauth2_redirect_url = root_path + oauth2_redirect_url
+    return get_swagger_ui_html(
+        openapi_url=root_path + "/openapi.json",
+        title=f"{get_settings().api_title} - Swagger UI",
+        oauth2_redirect_url=oauth2_redirect_url,
+        init_oauth=app.swagger_ui_init_oauth,
+        swagger_ui_parameters=app.swagger_ui_parameters
+    )
+
+@app.get("/docs/oauth2-redirect", include_in_schema=False)
+async def swagger_ui_redirect():
+    """Swagger UI OAuth2 리다이렉트 페이지"""
+    return get_swagger_ui_oauth2_redirect_html()
+
+@app.get("/redoc", include_in_schema=False)
+async def redoc(request: Request):
+    """ReDoc 문서 페이지"""
+    return get_redoc_html(
+        openapi_url=_root_path(request) + "/openapi.json",
+        title=f"{get_settings().api_title} - ReDoc"
+    )
 
 @app.on_event("startup")
 async def startup_event():
     """애플리케이션 시작 시 실행되는 이벤트"""
-    logger.info(f"Cherry AI - Google AI Studio LLM Server 시작")
-    logger.info(f"서버 주소: http://{settings.host}:{settings.port}")
-    logger.info(f"API 문서: http://{settings.host}:{settings.port}/docs")
-    logger.info(f"사용 모델: {settings.google_ai_model}")
+    settings = get_settings()
+    
+    logger.info("Cherry AI - Google AI Studio LLM Server 시작")
+    logger.info("서버 주소: http://%s:%d", settings.host, settings.port)
+    logger.info("API 문서: http://%s:%d/docs", settings.host, settings.port)
+    logger.info("사용 모델: %s", settings.google_ai_model)
+    
+    # OpenAPI 스키마 미리 생성
+    _openapi_bytes()
 
 @app.on_event("shutdown")
 async def shutdown_event():
@@ -114,10 +188,14 @@ async def shutdown_event():
     logger.info("Cherry AI - Google AI Studio LLM Server 종료")
 
 if __name__ == "__main__":
+    settings = get_settings()
+    
     uvicorn.run(
         "main:app",
         host=settings.host,
         port=settings.port,
         reload=settings.reload,
+        loop="uvloop",
+        http="httptools",
         log_level="info"
     ) 
\ No newline at end of file